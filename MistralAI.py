@@ -1,10 +1,35 @@
+import os
+import sys
+import logging
 import uuid
+import time
+import random
+import asyncio
+import threading
 import requests
-import json
-from datetime import datetime
-from typing import Optional, Dict, Any
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from urllib3.util.request import ACCEPT_ENCODING
+from datetime import datetime, timedelta
+from typing import Optional, Dict, Any, List, Tuple, Iterable, Iterator, Hashable, Callable
+from collections import OrderedDict, deque
+from concurrent.futures import Executor, ThreadPoolExecutor, as_completed
 from enum import Enum
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+
+try:
+    import orjson
+    _dumps = orjson.dumps
+    _loads = orjson.loads
+except ImportError:
+    import json
+
+    def _dumps(obj: Any) -> bytes:
+        return json.dumps(obj, separators=(",", ":")).encode("utf-8")
+
+    _loads = json.loads
+
+logger = logging.getLogger(__name__)
 
 class MistralAIError(Exception):
     """Base exception for all Mistral AI related errors."""
@@ -49,7 +74,87 @@ class ModelType(Enum):
     PIXTRAL = "pixtral-12b-2409"
     WEB_SEARCH = "pandragon"
 
-@dataclass
+# Exception raised for each non-200 status; anything unlisted is a NetworkConnectionError
+_STATUS_EXCEPTIONS = {
+    401: AuthenticationError,
+    403: AuthenticationError,
+    404: AuthenticationError,
+    429: RateLimitError,
+    500: NetworkConnectionError,
+    503: ModelUnavailableError,
+}
+
+# Buffered characters that force a stdout flush when stream_flush_interval is set
+_STREAM_FLUSH_CHARS = 64
+
+# Prefix of stream lines that carry response text
+_SSE_DATA_PREFIX = b"0:"
+
+# Translation table removing line breaks when strip_newlines is enabled
+_NL_STRIP = str.maketrans("", "", "\n\r")
+
+# Connections kept per host by the session's pool; also caps achat_many's concurrency
+_POOL_MAXSIZE = 16
+
+# Number of message IDs drawn from os.urandom per refill
+_MESSAGE_ID_BATCH = 64
+
+# Longest Retry-After wait honoured before retrying, in seconds
+_RETRY_AFTER_MAX = 10.0
+
+# Upper bound of the random delay added to each backoff, in seconds
+_RETRY_BACKOFF_JITTER = 0.5
+
+class _Retry(Retry):
+    """
+    Retry policy that adds jitter to the backoff and caps how long a
+    Retry-After header can make us sleep.
+
+    Jitter is applied here rather than through Retry(backoff_jitter=...),
+    which only exists in urllib3 2.x.
+    """
+
+    def get_backoff_time(self) -> float:
+        backoff = super().get_backoff_time()
+        if backoff <= 0:
+            return backoff
+        return backoff + random.random() * _RETRY_BACKOFF_JITTER
+
+    def get_retry_after(self, response) -> Optional[float]:
+        retry_after = super().get_retry_after(response)
+        if retry_after is None:
+            return None
+        return min(retry_after, _RETRY_AFTER_MAX)
+
+def _uuid_pool(n: int) -> Iterator[str]:
+    """Yield n random UUID4 strings generated from a single os.urandom call."""
+    buf = os.urandom(16 * n)
+    for i in range(0, 16 * n, 16):
+        yield str(uuid.UUID(bytes=buf[i:i + 16], version=4))
+
+def _iter_stream_lines(response: requests.Response, chunk_size: int = 8192) -> Iterator[bytes]:
+    """
+    Split a streamed response body into lines as chunks arrive.
+
+    Args:
+        response (requests.Response): Streaming response
+        chunk_size (int, optional): Maximum bytes read per chunk. Defaults to 8192.
+
+    Yields:
+        bytes: One line without its trailing newline (a CR, if any, is kept;
+            the JSON decoder treats it as whitespace)
+    """
+    pending = b""
+    for chunk in response.iter_content(chunk_size=chunk_size, decode_unicode=False):
+        # One bytes.split per chunk does the scanning in C; the last piece
+        # is an incomplete line carried over to the next chunk
+        lines = (pending + chunk).split(b"\n")
+        pending = lines.pop()
+        yield from lines
+    if pending:
+        yield pending
+
+@dataclass(slots=True)
 class MistralAIClient:
     """
     A simplified client for interacting with Mistral AI.
@@ -58,10 +163,35 @@ class MistralAIClient:
         cookies (str): Authentication cookies
         chat_id (str): Chat session identifier
         print_responses (bool, optional): Whether to print AI responses. Defaults to True.
+        cache_size (int, optional): Maximum number of cached responses. Defaults to 0 (caching disabled).
+            A cache hit is not sent, so the message is not added to the chat's history.
+        cache_ttl (float, optional): Seconds a cached response stays valid. Defaults to None (no expiry).
+        strip_newlines (bool, optional): Remove line breaks from returned responses. Defaults to False.
+        max_retries (int, optional): Retries for connection errors and 429/503 responses. Defaults to 2.
+        respect_retry_after (bool, optional): Wait as long as the server's Retry-After header asks,
+            up to 10 seconds per retry. Defaults to True.
+        stream_flush_interval (float, optional): When set, printed output is buffered and written
+            every this many seconds or 64 characters instead of after every token. Defaults to None.
     """
     cookies: str
     chat_id: str
     print_responses: bool = True
+    cache_size: int = 0
+    cache_ttl: Optional[float] = None
+    strip_newlines: bool = False
+    max_retries: int = 2
+    respect_retry_after: bool = True
+    stream_flush_interval: Optional[float] = None
+
+    # Internal state, set up in __post_init__
+    _chat_template: Dict[str, Any] = field(init=False, default=None, repr=False, compare=False)
+    _search_template: Dict[str, Any] = field(init=False, default=None, repr=False, compare=False)
+    _message_ids: "deque[str]" = field(init=False, default=None, repr=False, compare=False)
+    _cached_date: Tuple[float, str] = field(init=False, default=None, repr=False, compare=False)
+    _cache: "OrderedDict[Hashable, tuple]" = field(init=False, default=None, repr=False, compare=False)
+    _cache_lock: threading.Lock = field(init=False, default=None, repr=False, compare=False)
+    _session: requests.Session = field(init=False, default=None, repr=False, compare=False)
+    _encoding_logged: bool = field(init=False, default=False, repr=False, compare=False)
 
     def __post_init__(self):
         """Validate initialization parameters."""
@@ -71,7 +201,109 @@ class MistralAIClient:
         if not self.chat_id or len(self.chat_id.strip()) == 0:
             raise InputValidationError("Chat ID cannot be empty")
 
-        self._headers = {"Cookie": self.cookies}
+        if self.cache_size < 0:
+            raise InputValidationError("Cache size cannot be negative")
+
+        if self.max_retries < 0:
+            raise InputValidationError("Max retries cannot be negative")
+
+        # Static parts of every request body
+        self._chat_template = {"chatId": self.chat_id, "mode": "append"}
+        self._search_template = {
+            **self._chat_template,
+            "model": ModelType.WEB_SEARCH.value,
+            "features": ["beta-websearch"],
+        }
+        self._message_ids = deque()
+        self._cached_date = (0.0, "")
+
+        # LRU cache of (timestamp, response) keyed by model and normalized query
+        self._cache = OrderedDict()
+        self._cache_lock = threading.Lock()
+
+        # One pooled session keeps TLS connections alive between calls
+        self._session = requests.Session()
+        self._session.headers.update({
+            "Cookie": self.cookies,
+            "Content-Type": "application/json",
+            # Includes br/zstd only when brotli/zstandard are installed to decode them
+            "Accept-Encoding": ACCEPT_ENCODING,
+        })
+        self._session.mount("https://", HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=_POOL_MAXSIZE,
+            # Only failures where the message cannot have been appended are
+            # retried: connect errors, 429 and 503. After a read error or a
+            # 502/504 from a gateway the upstream may already have appended it,
+            # so resending the POST could duplicate it; read errors are
+            # re-raised as is (read=False). Once retries run out the last
+            # response is mapped to an exception below.
+            max_retries=_Retry(
+                total=self.max_retries,
+                read=False,
+                backoff_factor=0.5,
+                status_forcelist=[429, 503],
+                allowed_methods=frozenset(["POST"]),
+                respect_retry_after_header=self.respect_retry_after,
+                raise_on_status=False
+            )
+        ))
+
+    def close(self):
+        """Release the pooled connections held by this client."""
+        self._session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def clear_cache(self):
+        """Drop all cached responses."""
+        with self._cache_lock:
+            self._cache.clear()
+
+    def _cache_get(self, key: Hashable) -> Optional[str]:
+        """Return a cached response for key, or None if missing or expired."""
+        with self._cache_lock:
+            entry = self._cache.get(key)
+            if entry is None:
+                return None
+            timestamp, value = entry
+            if self.cache_ttl is not None and time.monotonic() - timestamp > self.cache_ttl:
+                del self._cache[key]
+                return None
+            self._cache.move_to_end(key)
+            return value
+
+    def _cache_put(self, key: Hashable, value: str):
+        """Store a response, evicting the least recently used entries over capacity."""
+        if self.cache_size == 0:
+            return
+        with self._cache_lock:
+            self._cache[key] = (time.monotonic(), value)
+            self._cache.move_to_end(key)
+            while len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+
+    def _next_message_id(self) -> str:
+        """Return a fresh message ID, refilling the pool in bulk when empty."""
+        try:
+            return self._message_ids.popleft()
+        except IndexError:
+            self._message_ids.extend(_uuid_pool(_MESSAGE_ID_BATCH))
+            return self._message_ids.popleft()
+
+    def _current_date(self) -> str:
+        """Return today's date as YYYY-MM-DD, reformatted only after local midnight."""
+        expires, value = self._cached_date
+        if time.time() >= expires:
+            now = datetime.now()
+            value = now.strftime('%Y-%m-%d')
+            midnight = now.replace(hour=0, minute=0, second=0, microsecond=0) + timedelta(days=1)
+            self._cached_date = (midnight.timestamp(), value)
+        return value
 
     def _validate_query(self, query: str):
         """
@@ -83,19 +315,181 @@ class MistralAIClient:
         Raises:
             InputValidationError: If query is invalid
         """
-        if not query or len(query.strip()) == 0:
+        if not query:
             raise InputValidationError("Query cannot be empty")
-        
+
+        # Check length before scanning so oversized input is rejected immediately
         if len(query) > 1000:  # Example max length check
             raise InputValidationError("Query is too long. Maximum 1000 characters allowed.")
 
-    def chat(self, user_query: str, model: ModelType = ModelType.LARGE_2) -> str:
+        # isspace() scans in place instead of building a stripped copy
+        if query.isspace():
+            raise InputValidationError("Query cannot be empty")
+
+    def _stream(self, payload: Dict[str, Any]) -> Iterator[str]:
+        """
+        Send a payload to the chat endpoint and yield text fragments as they arrive.
+
+        Args:
+            payload (Dict[str, Any]): Request body
+
+        Yields:
+            str: Response text fragment
+
+        Raises:
+            AuthenticationError: If authentication fails
+            ModelUnavailableError: If the requested model is unavailable
+            NetworkConnectionError: If network issues occur
+            RateLimitError: If API rate limits are exceeded
+        """
+        try:
+            with self._session.post(
+                "https://chat.mistral.ai/api/chat",
+                data=_dumps(payload),
+                stream=True,
+                timeout=30  # 30 seconds timeout
+            ) as response:
+                # Handle specific error scenarios
+                code = response.status_code
+                if code != 200:
+                    error = _STATUS_EXCEPTIONS.get(code, NetworkConnectionError)
+                    if error is ModelUnavailableError:
+                        raise error(payload["model"])
+                    if error is NetworkConnectionError:
+                        raise error(f"Unexpected error: {code}")
+                    if error is RateLimitError and "Retry-After" in response.headers:
+                        raise error(
+                            "API rate limit exceeded. Please try again later "
+                            f"(Retry-After: {response.headers['Retry-After']})."
+                        )
+                    raise error()
+
+                if not self._encoding_logged:
+                    self._encoding_logged = True
+                    logger.debug(
+                        "Response Content-Encoding: %s",
+                        response.headers.get("Content-Encoding", "identity")
+                    )
+
+                for raw in _iter_stream_lines(response):
+                    if not raw.startswith(_SSE_DATA_PREFIX):
+                        continue
+                    try:
+                        # Text frames are JSON string literals: 0:"..."
+                        content = _loads(raw[2:])
+                    except ValueError:
+                        raise NetworkConnectionError(f"Malformed response line: {raw[:80]!r}")
+                    yield content
+
+        except requests.Timeout:
+            raise NetworkConnectionError("Request timed out")
+        except requests.ConnectionError:
+            raise NetworkConnectionError("Could not connect to Mistral AI")
+        except requests.RequestException as e:
+            raise NetworkConnectionError(f"Network error: {e}")
+
+    def _collect(
+        self,
+        fragments: Iterable[str],
+        print_response: bool,
+        on_token: Optional[Callable[[str], None]] = None
+    ) -> str:
+        """
+        Assemble streamed fragments into the complete response.
+
+        Args:
+            fragments (Iterable[str]): Response text fragments
+            print_response (bool): Whether to echo fragments as they arrive
+            on_token (Callable[[str], None], optional): Called with each fragment
+
+        Returns:
+            str: Assembled response text
+        """
+        parts = []
+        parts_append = parts.append
+        strip_newlines = self.strip_newlines
+        flush_interval = self.stream_flush_interval
+
+        # Printed fragments not yet written to stdout (only with stream_flush_interval)
+        pending = []
+        pending_size = 0
+        last_flush = time.monotonic()
+        try:
+            for content in fragments:
+                if print_response:
+                    if flush_interval is None:
+                        sys.stdout.write(content)
+                        sys.stdout.flush()
+                    else:
+                        pending.append(content)
+                        pending_size += len(content)
+                        now = time.monotonic()
+                        if pending_size >= _STREAM_FLUSH_CHARS or now - last_flush >= flush_interval:
+                            sys.stdout.write("".join(pending))
+                            sys.stdout.flush()
+                            pending.clear()
+                            pending_size = 0
+                            last_flush = now
+                if on_token is not None:
+                    on_token(content)
+                if strip_newlines:
+                    content = content.translate(_NL_STRIP)
+                parts_append(content)
+        finally:
+            if pending:
+                sys.stdout.write("".join(pending))
+                sys.stdout.flush()
+
+        return "".join(parts)
+
+    def _chat_payload(self, user_query: str, model: ModelType) -> Dict[str, Any]:
+        """Build the request body for a chat message."""
+        return {
+            **self._chat_template,
+            "messageId": self._next_message_id(),
+            "model": model.value,
+            "messageInput": user_query,
+        }
+
+    def chat_stream(self, user_query: str, model: ModelType = ModelType.LARGE_2) -> Iterator[str]:
+        """
+        Send a message to Mistral AI and iterate over the response as it streams in.
+
+        Nothing is printed or cached; the request is sent when iteration starts.
+
+        Args:
+            user_query (str): Message to send to the AI
+            model (ModelType, optional): AI model to use. Defaults to LARGE_2.
+
+        Yields:
+            str: Response text fragment
+
+        Raises:
+            Same exceptions as chat method
+        """
+        # Validate input
+        self._validate_query(user_query)
+        return self._stream(self._chat_payload(user_query, model))
+
+    def chat(
+        self,
+        user_query: str,
+        model: ModelType = ModelType.LARGE_2,
+        print_response: Optional[bool] = None,
+        on_token: Optional[Callable[[str], None]] = None
+    ) -> str:
         """
         Send a message to Mistral AI and get a response.
 
         Args:
             user_query (str): Message to send to the AI
             model (ModelType, optional): AI model to use. Defaults to LARGE_2.
+            print_response (bool, optional): Override print_responses for this call.
+            on_token (Callable[[str], None], optional): Called with each response
+                fragment as it arrives, or once with the whole response on a cache hit.
+
+        When caching is enabled, a repeated query to the same model returns the
+        cached response without sending the message to the chat.
 
         Returns:
             str: AI's response
@@ -109,59 +503,27 @@ class MistralAIClient:
         """
         # Validate input
         self._validate_query(user_query)
+        if print_response is None:
+            print_response = self.print_responses
 
-        payload = {
-            "chatId": self.chat_id,
-            "messageId": str(uuid.uuid4()),
-            "model": model.value,
-            "messageInput": user_query,
-            "mode": "append"
-        }
-
-        try:
-            response = requests.post(
-                "https://chat.mistral.ai/api/chat", 
-                headers=self._headers, 
-                data=json.dumps(payload), 
-                stream=True,
-                timeout=30  # 30 seconds timeout
-            )
-
-            # Handle specific error scenarios
-            if response.status_code == 401:
-                raise AuthenticationError()         
-            if response.status_code == 404:
-                raise AuthenticationError()
-            if response.status_code == 500:
-                raise AuthenticationError()
-            elif response.status_code == 429:
-                raise RateLimitError()
-            elif response.status_code != 200:
-                raise NetworkConnectionError(f"Unexpected error: {response.status_code}")
-
-            complete_response = ''
-            for line in response.iter_lines(decode_unicode=True, chunk_size=1):
-                if line.startswith("0:"):
-                    content = line[3:-1]
-                    if self.print_responses:
-                        print(content, end='', flush=True)
-                    complete_response += content
-            
-            return complete_response.replace('\n', '')
+        cache_key = (model.value, user_query.strip())
+        cached = self._cache_get(cache_key)
+        if cached is not None:
+            return self._collect((cached,), print_response, on_token)
 
-        except requests.Timeout:
-            raise NetworkConnectionError("Request timed out")
-        except requests.ConnectionError:
-            raise NetworkConnectionError("Could not connect to Mistral AI")
-        except requests.RequestException as e:
-            raise NetworkConnectionError(f"Network error: {e}")
+        complete_response = self._collect(
+            self._stream(self._chat_payload(user_query, model)), print_response, on_token
+        )
+        self._cache_put(cache_key, complete_response)
+        return complete_response
 
-    def web_search(self, query: str) -> str:
+    def web_search(self, query: str, print_response: Optional[bool] = None) -> str:
         """
         Perform a web search using Mistral AI.
 
         Args:
             query (str): Search query
+            print_response (bool, optional): Override print_responses for this call.
 
         Returns:
             str: Search results
@@ -171,56 +533,167 @@ class MistralAIClient:
         """
         # Validate input
         self._validate_query(query)
+        if print_response is None:
+            print_response = self.print_responses
+
+        current_date = self._current_date()
+        cache_key = (ModelType.WEB_SEARCH.value, query.strip(), current_date)
+        cached = self._cache_get(cache_key)
+        if cached is not None:
+            return self._collect((cached,), print_response)
 
         payload = {
-            'chatId': self.chat_id,
-            'mode': 'append',
-            'model': ModelType.WEB_SEARCH.value,
+            **self._search_template,
             'messageInput': query,
-            'messageId': str(uuid.uuid4()),
-            'features': ['beta-websearch'],
+            'messageId': self._next_message_id(),
             'clientPromptData': {
-                'currentDate': datetime.now().strftime('%Y-%m-%d'),
+                'currentDate': current_date,
             },
         }
 
+        complete_response = self._collect(self._stream(payload), print_response)
+        self._cache_put(cache_key, complete_response)
+        return complete_response
+
+    async def achat(
+        self,
+        user_query: str,
+        model: ModelType = ModelType.LARGE_2,
+        executor: Optional[Executor] = None
+    ) -> str:
+        """
+        Coroutine version of chat. The request runs in a worker thread so several
+        calls can be awaited concurrently. Responses are not printed.
+
+        Args:
+            user_query (str): Message to send to the AI
+            model (ModelType, optional): AI model to use. Defaults to LARGE_2.
+            executor (Executor, optional): Executor to run the request in.
+                Defaults to the event loop's default executor.
+
+        Returns:
+            str: AI's response
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(executor, self.chat, user_query, model, False)
+
+    async def aweb_search(self, query: str, executor: Optional[Executor] = None) -> str:
+        """
+        Coroutine version of web_search. Responses are not printed.
+
+        Args:
+            query (str): Search query
+            executor (Executor, optional): Executor to run the request in.
+                Defaults to the event loop's default executor.
+
+        Returns:
+            str: Search results
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(executor, self.web_search, query, False)
+
+    async def achat_many(
+        self,
+        queries: Iterable[str],
+        model: ModelType = ModelType.LARGE_2,
+        max_concurrency: int = 10
+    ) -> List[str]:
+        """
+        Send several messages concurrently.
+
+        Args:
+            queries (Iterable[str]): Messages to send to the AI
+            model (ModelType, optional): AI model to use. Defaults to LARGE_2.
+            max_concurrency (int, optional): Maximum requests in flight, capped at the
+                connection pool size (16). Defaults to 10.
+
+        Returns:
+            List[str]: Responses in the same order as queries
+
+        Raises:
+            Same exceptions as chat method; the first failure is propagated.
+        """
+        if max_concurrency < 1:
+            raise InputValidationError("max_concurrency must be at least 1")
+
+        # A dedicated pool so the limit doesn't depend on the loop's default
+        # executor, which is sized by CPU count. Beyond the connection pool size
+        # urllib3 would open connections only to discard them afterwards.
+        executor = ThreadPoolExecutor(max_workers=min(max_concurrency, _POOL_MAXSIZE))
         try:
-            response = requests.post(
-                "https://chat.mistral.ai/api/chat", 
-                headers=self._headers, 
-                json=payload, 
-                stream=True,
-                timeout=30
-            )
+            return list(await asyncio.gather(
+                *(self.achat(query, model, executor) for query in queries)
+            ))
+        finally:
+            executor.shutdown(wait=False)
+
+    def chat_many(
+        self,
+        queries: Iterable[str],
+        model: ModelType = ModelType.LARGE_2,
+        max_concurrency: int = 10
+    ) -> List[str]:
+        """
+        Blocking wrapper around achat_many. Must not be called from a running event loop.
 
-            # Handle specific error scenarios
-            if response.status_code == 401:
-                raise AuthenticationError()         
-            if response.status_code == 404:
-                raise AuthenticationError()
-            if response.status_code == 500:
-                raise AuthenticationError()
-            elif response.status_code == 429:
-                raise RateLimitError()
-            elif response.status_code != 200:
-                raise NetworkConnectionError(f"Unexpected error: {response.status_code}")
-
-            complete_response = ''
-            for line in response.iter_lines(decode_unicode=True, chunk_size=1):
-                if line.startswith("0:"):
-                    content = line[3:-1]
-                    if self.print_responses:
-                        print(content, end='', flush=True)
-                    complete_response += content
-            
-            return complete_response.replace('\n', '')
+        Streams cannot be printed while they interleave, so when print_responses
+        is enabled each response is printed once all of them have completed.
 
-        except requests.Timeout:
-            raise NetworkConnectionError("Request timed out")
-        except requests.ConnectionError:
-            raise NetworkConnectionError("Could not connect to Mistral AI")
-        except requests.RequestException as e:
-            raise NetworkConnectionError(f"Network error: {e}")
+        Args:
+            queries (Iterable[str]): Messages to send to the AI
+            model (ModelType, optional): AI model to use. Defaults to LARGE_2.
+            max_concurrency (int, optional): Maximum requests in flight, capped at the
+                connection pool size (16). Defaults to 10.
+
+        Returns:
+            List[str]: Responses in the same order as queries
+        """
+        responses = asyncio.run(self.achat_many(queries, model, max_concurrency))
+        if self.print_responses:
+            for response in responses:
+                print(response)
+        return responses
+
+    def chat_multi(
+        self,
+        user_query: str,
+        models: Iterable[ModelType],
+        max_workers: int = 4
+    ) -> Dict[ModelType, str]:
+        """
+        Ask several models the same question in parallel.
+
+        When print_responses is enabled each response is printed, in the order
+        of models, once all of them have completed.
+
+        Args:
+            user_query (str): Message to send to the AI
+            models (Iterable[ModelType]): Models to query
+            max_workers (int, optional): Maximum parallel requests. Defaults to 4.
+
+        Returns:
+            Dict[ModelType, str]: Response of each model, in the order of models
+
+        Raises:
+            Same exceptions as chat method; the first failure is propagated.
+        """
+        if max_workers < 1:
+            raise InputValidationError("max_workers must be at least 1")
+        self._validate_query(user_query)
+
+        models = list(dict.fromkeys(models))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {
+                executor.submit(self.chat, user_query, model, False): model
+                for model in models
+            }
+            results = {futures[future]: future.result() for future in as_completed(futures)}
+
+        responses = {model: results[model] for model in models}
+        if self.print_responses:
+            for model, response in responses.items():
+                print(f"[{model.name}] {response}")
+        return responses
 
 # Simple example usage
 if __name__ == "__main__":